@@ -169,6 +169,8 @@ class BaseOneIndex(BaseGaussianRelatedArray):
             )
             # transform
             # ASSUME array always has shape (M, L, ...)
+            # NOTE: transformation is cast so that the array keeps its data type
+            transform = transform.astype(matrix_contraction.dtype, copy=False)
             matrix_contraction = np.tensordot(transform, matrix_contraction, (1, 1))
             matrix_contraction = np.concatenate(np.swapaxes(matrix_contraction, 0, 1), axis=0)
             # store
@@ -234,6 +236,8 @@ class BaseOneIndex(BaseGaussianRelatedArray):
                 )
                 # Apply the transform.
                 # ASSUME array always has shape (M, L, ...)
+                # NOTE: transformation is cast so that the array keeps its data type
+                transform = transform.astype(matrix_contraction.dtype, copy=False)
                 matrix_contraction = np.tensordot(transform, matrix_contraction, (1, 1))
                 matrix_contraction = np.swapaxes(matrix_contraction, 0, 1)
             matrix_contraction = np.concatenate(matrix_contraction, axis=0)
@@ -1,6 +1,388 @@
 """Derivative of a Gaussian Contraction."""
+import functools
+import math
+
 import numpy as np
-from scipy.special import comb, eval_hermite, perm
+from scipy.special import comb, perm
+
+
+def _combinatorial_tables(size):
+    r"""Return the tables of binomial coefficients and of the numbers of permutations.
+
+    Parameters
+    ----------
+    size : int
+        Number of rows and columns of the tables.
+
+    Returns
+    -------
+    binom : np.ndarray(size, size)
+        Binomial coefficients, :math:`\binom{n}{k}`, where `n` is the row and `k` is the column.
+    perm : np.ndarray(size, size)
+        Numbers of `k`-permutations of `n`, :math:`\frac{n!}{(n - k)!}`, where `n` is the row and
+        `k` is the column.
+
+    """
+    binom_table = np.zeros((size, size))
+    perm_table = np.zeros((size, size))
+    binom_table[:, 0] = 1
+    perm_table[:, 0] = 1
+    for n in range(1, size):
+        binom_table[n, 1:] = binom_table[n - 1, :-1] + binom_table[n - 1, 1:]
+        perm_table[n, 1:] = n * perm_table[n - 1, :-1]
+    return binom_table, perm_table
+
+
+_BINOM, _PERM = _combinatorial_tables(32)
+# number of points that are evaluated together in `_eval_deriv_contractions`
+_NUM_POINTS_BLOCK = 4096
+# highest order of the derivative that is evaluated with `_eval_deriv_1d_recursion`
+_MAX_ORDER_RECURSION = 4
+
+
+@functools.lru_cache(maxsize=1024)
+def _neg_sqrt_alphas_powers(alphas, max_power):
+    r"""Return the powers of the negative square roots of the exponents of the primitives.
+
+    The powers only depend on the exponents, which are shared by every evaluation of the same
+    contraction, so they are cached.
+
+    Parameters
+    ----------
+    alphas : tuple of float
+        Exponents (precisions) of the primitives.
+    max_power : int
+        Highest power.
+
+    Returns
+    -------
+    powers : np.ndarray(max_power + 1, K)
+        Powers, :math:`(-\sqrt{\alpha})^t`, of the exponents.
+        Dimension 0 corresponds to the power and dimension 1 corresponds to the primitive.
+        Array is read-only because it is shared by all calls with the same arguments.
+
+    """
+    powers = np.empty((max_power + 1, len(alphas)))
+    powers[0] = 1
+    neg_sqrt_alphas = -np.sqrt(alphas)
+    for i in range(max_power):
+        powers[i + 1] = powers[i] * neg_sqrt_alphas
+    powers.flags.writeable = False
+    return powers
+
+
+@functools.lru_cache(maxsize=None)
+def _deriv_polynomial_structure(order, angmom_comp):
+    r"""Return the coefficients of the polynomial in the derivative as polynomials of the exponent.
+
+    The polynomial, :math:`P_n(x)`, is obtained by differentiating one order at a time:
+
+    .. math::
+
+        P_0(x) &= x^a\\
+        P_{n+1}(x) &= P_n'(x) - 2 \alpha x P_n(x)
+
+    Each coefficient of :math:`P_n(x)` is a polynomial of :math:`\alpha` with integer coefficients
+    that only depend on the order and the angular momentum component. These integers are cached
+    for each order and angular momentum components, so the recursion is only carried out once for
+    each type of shell, regardless of the exponents.
+
+    Parameters
+    ----------
+    order : int
+        Order of the derivative.
+    angmom_comp : tuple of int
+        Component of the angular momentum vectors along the given dimension.
+        Negative components result in zero (as in `_eval_deriv_1d_hermite`).
+
+    Returns
+    -------
+    structure : np.ndarray(P, order + 1, L)
+        Coefficients of the powers of the exponent in the coefficients of the polynomial.
+        Dimension 0 corresponds to the power of the coordinate, dimension 1 to the power of the
+        exponent, and dimension 2 to the angular momentum vector.
+        Array is read-only because it is shared by all calls with the same arguments.
+
+    """
+    angmom_comp = np.array(angmom_comp, dtype=int)
+
+    num_powers = max(np.max(angmom_comp), 0) + order + 1
+    structure = np.zeros((num_powers, order + 1, angmom_comp.size), dtype=int)
+    indices_angmom = np.where(angmom_comp >= 0)[0]
+    structure[angmom_comp[indices_angmom], 0, indices_angmom] = 1
+    powers = np.arange(1, num_powers)[:, np.newaxis, np.newaxis]
+    for _ in range(order):
+        new_structure = np.zeros(structure.shape, dtype=int)
+        new_structure[:-1] = powers * structure[1:]
+        new_structure[1:, 1:] -= 2 * structure[:-1, :-1]
+        structure = new_structure
+    structure.flags.writeable = False
+    return structure
+
+
+@functools.lru_cache(maxsize=1024)
+def _deriv_polynomial_coeffs(order, angmom_comp, alphas):
+    """Return the coefficients of the polynomial in the derivative of the primitives.
+
+    See `_deriv_polynomial_structure` for the polynomial. The coefficients do not depend on the
+    coordinates, so they are cached.
+
+    Parameters
+    ----------
+    order : int
+        Order of the derivative.
+    angmom_comp : tuple of int
+        Component of the angular momentum vectors along the given dimension.
+        Negative components result in zero (as in `_eval_deriv_1d_hermite`).
+    alphas : tuple of float
+        Exponents (precisions) of the primitives.
+
+    Returns
+    -------
+    coeffs : np.ndarray(P, K, L)
+        Coefficients of the polynomial.
+        Dimension 0 corresponds to the power of the coordinate, dimension 1 to the primitive, and
+        dimension 2 to the angular momentum vector.
+        Array is read-only because it is shared by all calls with the same arguments.
+
+    """
+    alphas_powers = np.vander(alphas, order + 1, increasing=True).T
+    coeffs = np.einsum(
+        "jpl,pk->jkl", _deriv_polynomial_structure(order, angmom_comp), alphas_powers
+    )
+    coeffs.flags.writeable = False
+    return coeffs
+
+
+def _hermite_polynomials(max_order, x):
+    """Return the (physicists') Hermite polynomials of all orders up to the given order.
+
+    The polynomials are built with the recurrence :math:`H_{t+1}(x) = 2x H_t(x) - 2t H_{t-1}(x)`,
+    so that each order costs only a couple of multiplications.
+
+    Parameters
+    ----------
+    max_order : int
+        Highest order of the Hermite polynomials.
+    x : np.ndarray
+        Points at which the Hermite polynomials are evaluated.
+
+    Returns
+    -------
+    hermite : np.ndarray(max_order + 1, ...)
+        Hermite polynomials evaluated at `x`.
+        Dimension 0 corresponds to the order of the Hermite polynomial.
+
+    """
+    hermite = np.empty((max_order + 1,) + x.shape, dtype=x.dtype)
+    hermite[0] = 1
+    if max_order > 0:
+        hermite[1] = 2 * x
+    for t in range(1, max_order):
+        hermite[t + 1] = 2 * x * hermite[t] - 2 * t * hermite[t - 1]
+    return hermite
+
+
+def _integer_powers(base, exponents):
+    """Return the base raised to the given integer exponents.
+
+    Since the exponents (i.e. angular momentum components) are small integers, the powers are
+    built by repeated multiplication and then gathered, instead of calling `pow` for each element.
+
+    Parameters
+    ----------
+    base : np.ndarray
+        Base of the power.
+    exponents : np.ndarray of int
+        Exponents of the power.
+        Must have the same number of dimensions as `base` and be broadcastable with it.
+
+    Returns
+    -------
+    powers : np.ndarray
+        Base raised to the given exponents.
+        Shape is the broadcasted shape of `base` and `exponents`.
+
+    """
+    # NOTE: negative exponents cannot be built from the ladder, so they use the generic power. The
+    # generic power is also used for a small base (e.g. a single point), where the overhead of
+    # building and gathering the ladder is larger than the cost of the power itself.
+    if base.size < 256 or exponents.size == 0 or np.min(exponents) < 0:
+        # NOTE: exponents are cast so that the powers keep the data type of the base (an integer
+        # array would promote a single precision base to double precision)
+        return base ** exponents.astype(base.dtype)
+    max_exponent = np.max(exponents)
+    powers = np.empty((max_exponent + 1,) + base.shape, dtype=base.dtype)
+    powers[0] = 1
+    for i in range(max_exponent):
+        powers[i + 1] = powers[i] * base
+    return np.take_along_axis(powers, exponents[np.newaxis], axis=0)[0]
+
+
+def _eval_deriv_1d_hermite(rel_coord, order, angmom_comp, alphas):
+    r"""Return the derivative of the primitives along one dimension without the Gaussian factor.
+
+    .. math::
+
+        e^{\alpha x^2} \frac{d^n}{dx^n} x^a e^{-\alpha x^2}
+        = \sum_{t=0}^{n} \binom{n}{t} \frac{a!}{(a - n + t)!} x^{a - n + t}
+        (-\sqrt{\alpha})^t H_t(\sqrt{\alpha} x)
+
+    Parameters
+    ----------
+    rel_coord : np.ndarray(N,)
+        Component of the coordinates relative to the center of the primitives.
+    order : int
+        Order of the derivative.
+        Must be greater than zero.
+    angmom_comp : np.ndarray(L,)
+        Component of the angular momentum vectors along the given dimension.
+    alphas : np.ndarray(K,)
+        Exponents (precisions) of the primitives.
+
+    Returns
+    -------
+    derivative : np.ndarray(K, L, N)
+        Derivative along the given dimension divided by the Gaussian.
+        Dimension 0 corresponds to the primitive, dimension 1 to the angular momentum vector, and
+        dimension 2 to the coordinate.
+
+    """
+    # NOTE: following convention will be used to organize the axis of the multidimensional arrays
+    # axis 0 = index for term in hermite polynomial (size: T = n + 1)
+    # axis 1 = index for angular momentum vector (size: L) or primitive (size: K)
+    # axis 2 = index for coordinate (out of a grid) (size: N)
+    indices_herm = np.arange(order + 1)[:, np.newaxis]
+    # get indices that are used as powers of the appropriate terms in the derivative
+    # NOTE: the negative indices must be turned into zeros (even though they are turned into
+    # zeros later anyways) because these terms are sometimes zeros (and negative power is
+    # undefined).
+    indices_angmom = angmom_comp - order + indices_herm
+    np.maximum(indices_angmom, 0, out=indices_angmom)
+    # get coefficients for all entries
+    # NOTE: the coefficients are separated into the part that does not depend on the primitive and
+    # the part that does (which is folded into the Hermite polynomials)
+    # NOTE: the coefficients are looked up from the tables unless the integers are too large
+    if order < _BINOM.shape[0] and np.max(angmom_comp) < _PERM.shape[0]:
+        coeffs = (
+            _BINOM[order, indices_herm] * _PERM[np.maximum(angmom_comp, 0), order - indices_herm]
+        )
+    else:
+        coeffs = comb(order, indices_herm) * perm(angmom_comp, order - indices_herm)
+    # zero out the appropriate terms
+    # NOTE: a mask is multiplied instead of assigning to the indices of the terms
+    coeffs *= indices_herm >= np.maximum(0, order - angmom_comp)
+    coeffs = coeffs.astype(rel_coord.dtype)[:, :, np.newaxis] * _integer_powers(
+        rel_coord[np.newaxis, np.newaxis, :], indices_angmom[:, :, np.newaxis]
+    )
+    # compute
+    alphas_powers = _neg_sqrt_alphas_powers(tuple(alphas.tolist()), order)
+    alphas_powers = alphas_powers.astype(rel_coord.dtype, copy=False)
+    hermite = _hermite_polynomials(order, -alphas_powers[1][:, np.newaxis] * rel_coord)
+    hermite *= alphas_powers[:, :, np.newaxis]
+    return np.einsum("tln,tkn->kln", coeffs, hermite)
+
+
+def _eval_deriv_1d_recursion(rel_coord, order, angmom_comp, alphas):
+    r"""Return the derivative of the primitives along one dimension without the Gaussian factor.
+
+    The derivative is a polynomial, :math:`P_n(x)`, times the Gaussian, where the polynomial is
+    obtained by differentiating one order at a time:
+
+    .. math::
+
+        P_0(x) &= x^a\\
+        P_{n+1}(x) &= P_n'(x) - 2 \alpha x P_n(x)
+
+    The coefficients of the polynomial do not depend on the coordinate, so the polynomial is
+    evaluated at all coordinates with a single matrix product against the powers of the coordinate.
+    This is faster than `_eval_deriv_1d_hermite` for low orders, but the number of terms grows with
+    the order.
+
+    Parameters
+    ----------
+    rel_coord : np.ndarray(N,)
+        Component of the coordinates relative to the center of the primitives.
+    order : int
+        Order of the derivative.
+        Must be greater than zero.
+    angmom_comp : np.ndarray(L,)
+        Component of the angular momentum vectors along the given dimension.
+        Negative components result in zero (as in `_eval_deriv_1d_hermite`).
+    alphas : np.ndarray(K,)
+        Exponents (precisions) of the primitives.
+
+    Returns
+    -------
+    derivative : np.ndarray(K, L, N)
+        Derivative along the given dimension divided by the Gaussian.
+        Dimension 0 corresponds to the primitive, dimension 1 to the angular momentum vector, and
+        dimension 2 to the coordinate.
+
+    """
+    coeffs = _deriv_polynomial_coeffs(order, tuple(angmom_comp.tolist()), tuple(alphas.tolist()))
+    coeffs = coeffs.astype(rel_coord.dtype, copy=False)
+    return np.tensordot(
+        coeffs,
+        _integer_powers(rel_coord[np.newaxis, :], np.arange(coeffs.shape[0])[:, np.newaxis]),
+        (0, 0),
+    )
+
+
+def _eval_deriv_prim(coord, orders, center, angmom_comps, alpha):
+    """Return the evaluation of the derivative of a Gaussian primitive at a single point.
+
+    Unlike `_eval_deriv_contractions`, the primitive is evaluated with scalar (Python) arithmetic,
+    which avoids the overhead of creating the multidimensional arrays for a single primitive at a
+    single point.
+
+    Parameters
+    ----------
+    coord : np.ndarray(3,)
+        Point in space where the derivative of the Gaussian primitive is evaluated.
+    orders : np.ndarray(3,)
+        Orders of the derivative.
+        Negative orders are treated as zero orders.
+    center : np.ndarray(3,)
+        Center of the Gaussian primitive.
+    angmom_comps : np.ndarray(3,)
+        Components of the angular momentum, :math:`(a_x, a_y, a_z)`.
+        Negative components are treated as in `_eval_deriv_contractions`.
+    alpha : float
+        Value of the exponential in the Gaussian primitive.
+
+    Returns
+    -------
+    derivative : float
+        Evaluation of the derivative.
+
+    """
+    rel_coord = [float(i) - float(j) for i, j in zip(coord, center)]
+    alpha = float(alpha)
+
+    derivative = math.exp(-alpha * sum(x ** 2 for x in rel_coord))
+    for x, order, angmom_comp in zip(rel_coord, orders, angmom_comps):
+        order, angmom_comp = int(order), int(angmom_comp)
+        if order <= 0:
+            # NOTE: negative components are raised with `numpy` so that zero results in infinity
+            # (as in `_eval_deriv_contractions`) rather than in a ZeroDivisionError
+            derivative *= x ** angmom_comp if angmom_comp >= 0 else float(np.power(x, angmom_comp))
+            continue
+        # NOTE: negative components result in zero (as in `_eval_deriv_contractions`)
+        if angmom_comp < 0:
+            return 0.0
+        # coefficients of the polynomial that multiplies the Gaussian (see
+        # `_eval_deriv_1d_recursion`)
+        coeffs = [0.0] * angmom_comp + [1.0]
+        for _ in range(order):
+            deriv_coeffs = [i * coeff for i, coeff in enumerate(coeffs)][1:] + [0.0, 0.0]
+            shifted_coeffs = [0.0] + [-2 * alpha * coeff for coeff in coeffs]
+            coeffs = [i + j for i, j in zip(deriv_coeffs, shifted_coeffs)]
+        polynomial = 0.0
+        for coeff in reversed(coeffs):
+            polynomial = polynomial * x + coeff
+        derivative *= polynomial
+    return derivative
 
 
 # TODO: in the case of generalized Cartesian contraction where multiple shells have the same sets of
@@ -8,7 +390,9 @@ from scipy.special import comb, eval_hermite, perm
 # `prim_coeffs` also.
 # FIXME: name is pretty bad
 # TODO: vectorize for multiple orders? Caching instead?
-def _eval_deriv_contractions(coords, orders, center, angmom_comps, alphas, prim_coeffs, norm):
+def _eval_deriv_contractions(
+    coords, orders, center, angmom_comps, alphas, prim_coeffs, norm, dtype=np.float64
+):
     """Return the evaluation of the derivative of a Cartesian contraction.
 
     Parameters
@@ -34,6 +418,11 @@ def _eval_deriv_contractions(coords, orders, center, angmom_comps, alphas, prim_
         contraction (with the same exponents and angular momentum).
     norm : np.ndarray(L, K)
         Normalization constants for the primitives in each contraction.
+    dtype : np.dtype
+        Data type of the evaluation and of the intermediate arrays.
+        Using `np.float32` halves the memory used by the intermediate arrays, at the cost of
+        precision.
+        Default is `np.float64`.
 
     Returns
     -------
@@ -55,88 +444,71 @@ def _eval_deriv_contractions(coords, orders, center, angmom_comps, alphas, prim_
     angular momentum vector will create multiple contractions according to the given coefficients.
 
     """
-    # pylint: disable=R0914
-    # NOTE: following convention will be used to organize the axis of the multidimensional arrays
-    # axis 0 = index for term in hermite polynomial (size: min(K, n)) where n is the order in given
-    # dimension
-    # axis 1 = index for primitive (size: K)
-    # axis 2 = index for dimension (x, y, z) of coordinate (size: 3)
-    # axis 3 = index for angular momentum vector (size: L)
-    # axis 4 = index for coordinate (out of a grid) (size: N)
-    # adjust the axis
-    coords = coords.T[np.newaxis, np.newaxis, :, np.newaxis, :]
-    # NOTE: if `coord` is two dimensional (3, N), then coords has shape (1, 1, 3, 1, N). If it is
-    # one dimensional (3,), then coords has shape (1, 1, 3, 1)
-    # NOTE: `order` is still assumed to be a one dimensional
-    center = center[np.newaxis, np.newaxis, :, np.newaxis, np.newaxis]
-    angmom_comps = angmom_comps.T[np.newaxis, np.newaxis, :, :, np.newaxis]
-    # NOTE: if `angmom_comps` is two-dimensional (3, L), has shape (1, 1, 3, L). If it is one
-    # dimensional (3, ) then it has shape (1, 1, 3)
-    alphas = alphas[np.newaxis, :, np.newaxis, np.newaxis, np.newaxis]
-    # NOTE: `prim_coeffs` will be used as a 1D array
-
-    # shift coordinates
-    coords = coords - center
-    # useful variables
-    gauss = np.exp(-alphas * coords ** 2)
-
-    # zeroth order (i.e. no derivatization)
-    indices_noderiv = orders <= 0
-
-    zero_coords = coords[:, :, indices_noderiv]
-    zero_angmom_comps = angmom_comps[:, :, indices_noderiv]
-    zero_gauss = gauss[:, :, indices_noderiv]
-
-    zeroth_part = np.prod(zero_coords ** zero_angmom_comps * zero_gauss, axis=(0, 2))
-    # NOTE: `zeroth_part` now has axis 0 for primitives, axis 1 for angular momentum vector, and
-    # axis 2 for coordinate
-
-    deriv_part = 1
-    nonzero_orders = orders[~indices_noderiv]
-    nonzero_orders = nonzero_orders[np.newaxis, np.newaxis, :, np.newaxis, np.newaxis]
-
-    # derivatization part
-    if nonzero_orders.size != 0:
-        # get nonzero arrays
-        nonzero_coords = coords[:, :, ~indices_noderiv]
-        nonzero_angmom_comps = angmom_comps[:, :, ~indices_noderiv]
-        nonzero_gauss = gauss[:, :, ~indices_noderiv]
-        # General approach: compute the whole coefficients, zero out the irrelevant parts
-        # NOTE: The following step assumes that there is only one set (nx, ny, nz) of derivatization
-        # orders i.e. we assume that only one axis (axis 2) of `nonzero_orders` has a dimension
-        # greater than 1
-        indices_herm = np.arange(np.max(nonzero_orders) + 1)[:, None, None, None, None]
-        # get indices that are used as powers of the appropriate terms in the derivative
-        # NOTE: the negative indices must be turned into zeros (even though they are turned into
-        # zeros later anyways) because these terms are sometimes zeros (and negative power is
-        # undefined).
-        indices_angmom = nonzero_angmom_comps - nonzero_orders + indices_herm
-        indices_angmom[indices_angmom < 0] = 0
-        # get coefficients for all entries
-        coeffs = (
-            comb(nonzero_orders, indices_herm)
-            * perm(nonzero_angmom_comps, nonzero_orders - indices_herm)
-            * (-(alphas ** 0.5)) ** indices_herm
-            * nonzero_coords ** indices_angmom
+    coords = np.asarray(coords, dtype=dtype)
+    center = np.asarray(center, dtype=dtype)
+    alphas = np.asarray(alphas, dtype=dtype)
+    prim_coeffs = np.asarray(prim_coeffs, dtype=dtype)
+    norm = np.asarray(norm, dtype=dtype)
+    # NOTE: a single primitive with a single angular momentum vector at a single point (e.g. when
+    # evaluating primitives one at a time) is evaluated with scalar arithmetic, which avoids the
+    # overhead of the multidimensional arrays. Multiple angular momentum vectors are evaluated
+    # with the arrays because the scalar evaluation would be repeated for each vector.
+    if coords.shape[0] == 1 and alphas.size == 1 and angmom_comps.shape[0] == 1:
+        derivative = norm[0, 0] * np.array(
+            _eval_deriv_prim(coords[0], orders, center, angmom_comps[0], alphas[0]), dtype=dtype
         )
-        # zero out the appropriate terms
-        indices_zero = np.where(indices_herm < np.maximum(0, nonzero_orders - nonzero_angmom_comps))
-        coeffs[indices_zero[0], :, indices_zero[2], indices_zero[3]] = 0
-        indices_zero = np.where(nonzero_orders < indices_herm)
-        coeffs[indices_zero[0], :, indices_zero[2]] = 0
-        # compute
-        # TODO: I don't know if the scipy.special.eval_hermite uses some smart vectorizing/caching
-        # to evaluate multiple orders at the same time. Creating/finding a better function for
-        # evaluating the hermite polynomial at different orders (in sequence) may be nice in the
-        # future.
-        hermite = np.sum(
-            coeffs * eval_hermite(indices_herm, alphas ** 0.5 * nonzero_coords), axis=0
+        return prim_coeffs[0][..., np.newaxis, np.newaxis] * derivative
+
+    # NOTE: the points are evaluated in blocks so that the intermediate arrays (which all have an
+    # axis for the points) stay small enough to remain in cache
+    derivative = np.empty(
+        prim_coeffs.shape[1:] + (angmom_comps.shape[0], coords.shape[0]), dtype=dtype
+    )
+
+    for i in range(0, coords.shape[0], _NUM_POINTS_BLOCK):
+        derivative[..., i : i + _NUM_POINTS_BLOCK] = _eval_deriv_contractions_block(
+            coords[i : i + _NUM_POINTS_BLOCK],
+            orders,
+            center,
+            angmom_comps,
+            alphas,
+            prim_coeffs,
+            norm,
         )
-        hermite = np.prod(hermite, axis=1)
+    return derivative
+
+
+def _eval_deriv_contractions_block(coords, orders, center, angmom_comps, alphas, prim_coeffs, norm):
+    """Return the evaluation of the derivative of a Cartesian contraction at a block of points.
+
+    See `_eval_deriv_contractions` for the parameters and the returned value.
+
+    """
+    # NOTE: the coordinates are stored as separate (contiguous) arrays for each of the x, y, and z
+    # components, and each component is treated independently
+    rel_coords = np.ascontiguousarray((coords - center).T)
+    # NOTE: the Gaussians of the x, y, and z components are computed together as a single
+    # exponential
+    gauss = np.exp(-alphas[:, np.newaxis] * np.sum(rel_coords ** 2, axis=0))
 
-        # NOTE: `hermite` now has axis 0 for primitives, 1 for angular momentum vector, and axis 2
-        # for coordinates
-        deriv_part = np.prod(nonzero_gauss, axis=(0, 2)) * hermite
+    # NOTE: `contractions` has axis 0 for primitives, axis 1 for angular momentum vector, and axis 2
+    # for coordinate
+    # NOTE: the factors of each dimension are multiplied into a single array in place, so that
+    # only one array of shape (K, L, N) is created
+    contractions = np.empty(
+        (alphas.size, angmom_comps.shape[0], rel_coords.shape[1]), dtype=rel_coords.dtype
+    )
+    contractions[...] = gauss[:, np.newaxis]
+    for rel_coord, order, angmom_comp in zip(rel_coords, orders, angmom_comps.T):
+        if order <= 0:
+            # zeroth order (i.e. no derivatization)
+            contractions *= _integer_powers(rel_coord[np.newaxis, :], angmom_comp[:, np.newaxis])
+        elif order <= _MAX_ORDER_RECURSION:
+            contractions *= _eval_deriv_1d_recursion(rel_coord, order, angmom_comp, alphas)
+        else:
+            contractions *= _eval_deriv_1d_hermite(rel_coord, order, angmom_comp, alphas)
 
-    norm = norm.T[:, :, np.newaxis]
-    return np.tensordot(prim_coeffs, norm * zeroth_part * deriv_part, (0, 0))
+    # NOTE: `contractions` is a temporary array, so the normalization is applied in place (instead
+    # of creating another array of the same size) before contracting the primitives
+    contractions *= norm.T[:, :, np.newaxis]
+    return np.tensordot(prim_coeffs, contractions, (0, 0))
@@ -25,7 +25,7 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
     Raises
     ------
     TypeError
-        If `orb_eval` is not a 2-dimensional `numpy` array with `dtype` float.
+        If `orb_eval` is not a 2-dimensional `numpy` array with a floating point `dtype`.
         If `one_density_matrix` is not a 2-dimensional `numpy` array with `dtype` float.
     ValueError
         If `one_density_matrix` is not square.
@@ -43,9 +43,14 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
             "One-electron density matrix must be a two-dimensional `numpy` array with `dtype`"
             " float."
         )
-    if not (isinstance(orb_eval, np.ndarray) and orb_eval.ndim == 2 and orb_eval.dtype == float):
+    if not (
+        isinstance(orb_eval, np.ndarray)
+        and orb_eval.ndim == 2
+        and np.issubdtype(orb_eval.dtype, np.floating)
+    ):
         raise TypeError(
-            "Evaluation of orbitals must be a two-dimensional `numpy` array with `dtype` float."
+            "Evaluation of orbitals must be a two-dimensional `numpy` array with a floating point "
+            "`dtype`."
         )
     if one_density_matrix.shape[0] != one_density_matrix.shape[1]:
         raise ValueError("One-electron density matrix must be a square matrix.")
@@ -57,12 +62,16 @@ def evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval):
             " of the orbital evaluations."
         )
 
-    density = one_density_matrix.dot(orb_eval)
+    # NOTE: density matrix is cast so that the density is evaluated in the same data type as the
+    # orbitals (e.g. single precision)
+    density = one_density_matrix.astype(orb_eval.dtype, copy=False).dot(orb_eval)
     density *= orb_eval
     return np.sum(density, axis=0)
 
 
-def evaluate_density(one_density_matrix, basis, points, transform=None, coord_type="spherical"):
+def evaluate_density(
+    one_density_matrix, basis, points, transform=None, coord_type="spherical", dtype=np.float64
+):
     r"""Return the density of the given basis set at the given points.
 
     Parameters
@@ -91,6 +100,11 @@ def evaluate_density(one_density_matrix, basis, points, transform=None, coord_ty
         If list/tuple, then each entry must be a "cartesian" or "spherical" to specify the
         coordinate type of each `GeneralizedContractionShell` instance.
         Default value is "spherical".
+    dtype : np.dtype
+        Data type of the evaluations of the basis functions and of the density.
+        Using `np.float32` halves the memory used during the evaluation, which is often precise
+        enough for plotting the density.
+        Default is `np.float64`.
 
     Returns
     -------
@@ -98,7 +112,9 @@ def evaluate_density(one_density_matrix, basis, points, transform=None, coord_ty
         Density evaluated at `N` grid points.
 
     """
-    orb_eval = evaluate_basis(basis, points, transform=transform, coord_type=coord_type)
+    orb_eval = evaluate_basis(
+        basis, points, transform=transform, coord_type=coord_type, dtype=dtype
+    )
     return evaluate_density_using_evaluated_orbs(one_density_matrix, orb_eval)
 
 
@@ -24,7 +24,7 @@ class Eval(BaseOneIndex):
     -------
     __init__(self, contractions)
         Initialize.
-    construct_array_contraction(contraction, points) : np.ndarray(M, L_cart, N)
+    construct_array_contraction(contraction, points, dtype) : np.ndarray(M, L_cart, N)
         Return the evaluations of the given Cartesian contractions at the given coordinates.
         `M` is the number of segmented contractions with the same exponents (and angular
         momentum).
@@ -53,7 +53,7 @@ class Eval(BaseOneIndex):
     """
 
     @staticmethod
-    def construct_array_contraction(contractions, points):
+    def construct_array_contraction(contractions, points, dtype=np.float64):
         r"""Return the evaluations of the given contractions at the given coordinates.
 
         Parameters
@@ -66,6 +66,11 @@ class Eval(BaseOneIndex):
             functions are evaluated.
             Rows correspond to the points and columns correspond to the :math:`x, y, \text{and} z`
             components.
+        dtype : np.dtype
+            Data type of the evaluations.
+            Using `np.float32` halves the memory used during the evaluation, which is often
+            precise enough for plotting the basis functions or their density.
+            Default is `np.float64`.
 
         Returns
         -------
@@ -106,12 +111,19 @@ class Eval(BaseOneIndex):
         center = contractions.coord
         norm_prim_cart = contractions.norm_prim_cart
         output = _eval_deriv_contractions(
-            points, np.zeros(3), center, angmom_comps, alphas, prim_coeffs, norm_prim_cart
+            points,
+            np.zeros(3),
+            center,
+            angmom_comps,
+            alphas,
+            prim_coeffs,
+            norm_prim_cart,
+            dtype=dtype,
         )
         return output
 
 
-def evaluate_basis(basis, points, transform=None, coord_type="spherical"):
+def evaluate_basis(basis, points, transform=None, coord_type="spherical", dtype=np.float64):
     r"""Evaluate the basis set in the given coordinate system at the given points.
 
     Parameters
@@ -136,6 +148,11 @@ def evaluate_basis(basis, points, transform=None, coord_type="spherical"):
         If list/tuple, then each entry must be a "cartesian" or "spherical" to specify the
         coordinate type of each `GeneralizedContractionShell` instance.
         Default value is "spherical".
+    dtype : np.dtype
+        Data type of the evaluations of the contractions.
+        Using `np.float32` halves the memory used during the evaluation, which is often precise
+        enough for plotting the basis functions or their density.
+        Default is `np.float64`.
 
     Returns
     -------
@@ -148,9 +165,15 @@ def evaluate_basis(basis, points, transform=None, coord_type="spherical"):
 
     """
     if transform is not None:
-        return Eval(basis).construct_array_lincomb(transform, coord_type, points=points)
+        # NOTE: the (real) transformation is cast so that the transformed array, which is usually
+        # the largest array, is also evaluated in the given data type
+        if not np.iscomplexobj(transform):
+            transform = np.asarray(transform, dtype=dtype)
+        return Eval(basis).construct_array_lincomb(
+            transform, coord_type, points=points, dtype=dtype
+        )
     if coord_type == "cartesian":
-        return Eval(basis).construct_array_cartesian(points=points)
+        return Eval(basis).construct_array_cartesian(points=points, dtype=dtype)
     if coord_type == "spherical":
-        return Eval(basis).construct_array_spherical(points=points)
-    return Eval(basis).construct_array_mix(coord_type, points=points)
+        return Eval(basis).construct_array_spherical(points=points, dtype=dtype)
+    return Eval(basis).construct_array_mix(coord_type, points=points, dtype=dtype)
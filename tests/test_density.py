@@ -74,6 +74,11 @@ def test_evaluate_density():
         evaluate_density(density, basis, points, transform),
         np.einsum("ij,ik,jk->k", density, evaluate_orbs, evaluate_orbs),
     )
+    density_single = evaluate_density(density, basis, points, transform, dtype=np.float32)
+    assert density_single.dtype == np.float32
+    assert np.allclose(
+        density_single, evaluate_density(density, basis, points, transform), rtol=1e-4
+    )
 
 
 def test_evaluate_deriv_density():
@@ -1,8 +1,19 @@
 """Test gbasis.evals._deriv."""
 import itertools as it
 
-from gbasis.evals._deriv import _eval_deriv_contractions
+from gbasis.evals._deriv import (
+    _BINOM,
+    _eval_deriv_1d_hermite,
+    _eval_deriv_1d_recursion,
+    _eval_deriv_contractions,
+    _eval_deriv_contractions_block,
+    _eval_deriv_prim,
+    _integer_powers,
+    _NUM_POINTS_BLOCK,
+    _PERM,
+)
 import numpy as np
+from scipy.special import comb, perm
 from utils import partial_deriv_finite_diff
 
 
@@ -34,15 +45,10 @@ def evaluate_deriv_prim(coord, orders, center, angmom_comps, alpha):
     `gbasis.evals._deriv.evaluate_deriv_contraction` instead.
 
     """
-    return _eval_deriv_contractions(
-        coord.reshape(1, 3),
-        orders,
-        center,
-        angmom_comps.reshape(1, 3),
-        np.array([alpha]),
-        np.array([1.0]),
-        np.array([[1]]),
-    )[0]
+    # NOTE: the derivative is returned as a one-dimensional array (like the evaluation of a single
+    # contraction at a single point) so that it can be combined with the output of
+    # `_eval_deriv_contractions`
+    return np.array([_eval_deriv_prim(coord, orders, center, angmom_comps, alpha)])
 
 
 def evaluate_prim(coord, center, angmom_comps, alpha):
@@ -73,6 +79,85 @@ def evaluate_prim(coord, center, angmom_comps, alpha):
     return evaluate_deriv_prim(coord, np.zeros(angmom_comps.shape), center, angmom_comps, alpha)
 
 
+def test_combinatorial_tables():
+    """Test gbasis.evals._deriv._combinatorial_tables."""
+    n = np.arange(_BINOM.shape[0])[:, None]
+    k = np.arange(_BINOM.shape[1])[None, :]
+    assert np.allclose(_BINOM, comb(n, k))
+    assert np.allclose(_PERM, perm(n, k))
+
+
+def test_eval_deriv_1d():
+    """Test gbasis.evals._deriv._eval_deriv_1d_recursion against _eval_deriv_1d_hermite."""
+    rel_coord = np.linspace(-3, 3, 13)
+    angmom_comp = np.arange(-1, 6)
+    alphas = np.array([0.1, 1.0, 5.0])
+    for order in range(1, 7):
+        assert np.allclose(
+            _eval_deriv_1d_recursion(rel_coord, order, angmom_comp, alphas),
+            _eval_deriv_1d_hermite(rel_coord, order, angmom_comp, alphas),
+        )
+    # angular momentum components that are too large for the tables
+    rel_coord = np.linspace(-1.1, 1.1, 13)
+    angmom_comp = np.array([0, 2, 33, 35])
+    assert np.allclose(
+        _eval_deriv_1d_recursion(rel_coord, 2, angmom_comp, alphas),
+        _eval_deriv_1d_hermite(rel_coord, 2, angmom_comp, alphas),
+    )
+
+
+def test_eval_deriv_1d_dtype():
+    """Test that the one-dimensional evaluations keep the data type of the coordinates."""
+    angmom_comp = np.array([0, 1, 3])
+    alphas = np.array([0.5, 1.0], dtype=np.float32)
+    # NOTE: fewer than 256 points use the generic power and more points use the ladder
+    for num_points in [100, 300]:
+        rel_coord = np.linspace(-3, 3, num_points, dtype=np.float32)
+        for exponents in [angmom_comp[:, None], np.array([[-1]])]:
+            assert _integer_powers(rel_coord[None, :], exponents).dtype == np.float32
+        assert _eval_deriv_1d_recursion(rel_coord, 2, angmom_comp, alphas).dtype == np.float32
+        assert _eval_deriv_1d_hermite(rel_coord, 6, angmom_comp, alphas).dtype == np.float32
+
+
+def test_eval_deriv_prim():
+    """Test gbasis.evals._deriv._eval_deriv_prim against _eval_deriv_contractions_block."""
+    for orders in it.product(range(-1, 7, 2), range(3), range(0, 7, 3)):
+        orders = np.array(orders)
+        for angmom_comps in it.product(range(4), range(2), range(0, 6, 5)):
+            angmom_comps = np.array(angmom_comps)
+            assert np.allclose(
+                _eval_deriv_prim(
+                    np.array([2, 3, 4]), orders, np.array([0.5, 1, 1.5]), angmom_comps, 0.7
+                ),
+                _eval_deriv_contractions_block(
+                    np.array([[2, 3, 4]]),
+                    orders,
+                    np.array([0.5, 1, 1.5]),
+                    angmom_comps.reshape(1, 3),
+                    np.array([0.7]),
+                    np.array([1.0]),
+                    np.array([[1.0]]),
+                ),
+            )
+    # negative components at and away from the center
+    for coord in [np.array([2, 3, 4]), np.array([0.5, 1, 1.5])]:
+        for orders in [np.array([0, 0, 0]), np.array([1, 0, 0]), np.array([0, 2, 0])]:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                assert np.allclose(
+                    _eval_deriv_prim(coord, orders, np.array([0.5, 1, 1.5]), [-1, 0, 0], 0.7),
+                    _eval_deriv_contractions_block(
+                        coord.reshape(1, 3),
+                        orders,
+                        np.array([0.5, 1, 1.5]),
+                        np.array([[-1, 0, 0]]),
+                        np.array([0.7]),
+                        np.array([1.0]),
+                        np.array([[1.0]]),
+                    ),
+                    equal_nan=True,
+                )
+
+
 def test_evaluate_prim():
     """Test gbasis.evals._deriv.evaluate_prim.
 
@@ -256,6 +341,31 @@ def test_evaluate_contractions():
             ],
         ],
     )
+    # single primitive at a single point with the arrays (instead of the scalar evaluation)
+    assert np.allclose(
+        _eval_deriv_contractions_block(
+            np.array([[1.0, 2.0, 3.0]]),
+            np.array([0, 0, 0]),
+            np.array([0.0, 0, 0]),
+            np.array([[0, 0, 0]]),
+            np.array([1.0]),
+            np.array([1.0]),
+            np.array([[1.0]]),
+        ),
+        np.exp(-1) * np.exp(-4) * np.exp(-9),
+    )
+    assert np.allclose(
+        _eval_deriv_contractions_block(
+            np.array([[2.0, 0, 0]]),
+            np.array([0, 0, 0]),
+            np.array([0.0, 3, 4]),
+            np.array([[2, 1, 3]]),
+            np.array([1.0]),
+            np.array([1.0]),
+            np.array([[1.0]]),
+        ),
+        4 * 3 * 4 ** 3 * np.exp(-(2 ** 2 + 3 ** 2 + 4 ** 2)),
+    )
 
 
 def test_eval_deriv_contractions():
@@ -592,3 +702,43 @@ def test_evaluate_deriv_generalized_contraction():
                     ]
                 ),
             )
+
+
+def test_eval_deriv_contractions_blocks():
+    """Test gbasis.evals._deriv._eval_deriv_contractions over multiple blocks of points."""
+    coords = np.random.rand(2 * _NUM_POINTS_BLOCK + 10, 3)
+    args = (
+        np.array([1, 0, 2]),
+        np.array([0.5, 1, 1.5]),
+        np.array([[2, 1, 0], [0, 1, 3]]),
+        np.array([1.0, 2.0]),
+        np.array([[3.0, 4.0, 5.0], [6.0, 7.0, 8.0]]),
+        np.array([[1.0, 2.0], [3.0, 4.0]]),
+    )
+    derivative = _eval_deriv_contractions(coords, *args)
+    assert derivative.shape == (3, 2, 2 * _NUM_POINTS_BLOCK + 10)
+    for i in [0, _NUM_POINTS_BLOCK - 1, _NUM_POINTS_BLOCK, 2 * _NUM_POINTS_BLOCK + 9]:
+        assert np.allclose(
+            derivative[:, :, i : i + 1], _eval_deriv_contractions(coords[i : i + 1], *args)
+        )
+
+
+def test_eval_deriv_contractions_single_prim():
+    """Test gbasis.evals._deriv._eval_deriv_contractions for a primitive at a single point."""
+    coord = np.array([[2.0, 3.0, 4.0]])
+    orders = np.array([1, 0, 2])
+    center = np.array([0.5, 1, 1.5])
+    alphas = np.array([0.7])
+    for angmom_comps, norm in [
+        (np.array([[2, 1, 0]]), np.array([[1.5]])),
+        (np.array([[2, 1, 0], [0, 1, 3]]), np.array([[1.5], [2.5]])),
+    ]:
+        args = (orders, center, angmom_comps, alphas)
+        for prim_coeffs in [np.array([2.0]), np.array([[2.0, 3.0]])]:
+            derivative = _eval_deriv_contractions(coord, *args, prim_coeffs, norm)
+            assert derivative.shape == prim_coeffs.shape[1:] + (angmom_comps.shape[0], 1)
+            assert np.allclose(
+                derivative, _eval_deriv_contractions_block(coord, *args, prim_coeffs, norm)
+            )
+            derivative = _eval_deriv_contractions(coord, *args, prim_coeffs, norm, dtype=np.float32)
+            assert derivative.dtype == np.float32
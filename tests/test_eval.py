@@ -147,6 +147,49 @@ def test_evaluate_basis_horton():
     assert np.allclose(evaluate_basis(basis, grid_3d, coord_type="spherical"), horton_eval_sph.T)
 
 
+def test_evaluate_basis_dtype():
+    """Test gbasis.evals.eval.evaluate_basis with single precision."""
+    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
+    points = np.array([[0, 0, 0], [0.8, 0, 0]])
+    basis = make_contractions(basis_dict, ["H", "He"], points)
+
+    coord_type_mix = ["spherical", "cartesian"] * (len(basis) // 2) + ["spherical"] * (
+        len(basis) % 2
+    )
+    num_sph = sum(cont.num_sph * cont.num_seg_cont for cont in basis)
+    transform = np.random.rand(3, num_sph)
+    # NOTE: grids with fewer and more than 256 points go through different paths for the powers
+    for num in [5, 7]:
+        grid_1d = np.linspace(-2, 2, num=num)
+        grid_x, grid_y, grid_z = np.meshgrid(grid_1d, grid_1d, grid_1d)
+        grid_3d = np.vstack([grid_x.ravel(), grid_y.ravel(), grid_z.ravel()]).T
+
+        eval_single = Eval.construct_array_contraction(basis[0], grid_3d, dtype=np.float32)
+        assert eval_single.dtype == np.float32
+        assert np.allclose(
+            eval_single,
+            Eval.construct_array_contraction(basis[0], grid_3d),
+            rtol=1e-5,
+            atol=1e-6,
+        )
+        for coord_type, kwargs in [
+            ("cartesian", {}),
+            ("spherical", {}),
+            (coord_type_mix, {}),
+            ("spherical", {"transform": transform}),
+        ]:
+            eval_single = evaluate_basis(
+                basis, grid_3d, coord_type=coord_type, dtype=np.float32, **kwargs
+            )
+            assert eval_single.dtype == np.float32
+            assert np.allclose(
+                eval_single,
+                evaluate_basis(basis, grid_3d, coord_type=coord_type, **kwargs),
+                rtol=1e-5,
+                atol=1e-5,
+            )
+
+
 def test_evaluate_basis_pyscf():
     """Test gbasis.evals.eval.evaluate_basis against pyscf results."""
     pytest.importorskip("pyscf")
@@ -3,19 +3,44 @@ from gbasis.integrals.overlap import overlap_integral
 from gbasis.integrals.overlap_asymm import overlap_integral_asymmetric
 from gbasis.parsers import make_contractions, parse_nwchem
 import numpy as np
+import pytest
 from utils import find_datafile, HortonContractions
 
 
-def test_overlap_integral_asymmetric_horton_anorcc_hhe():
+@pytest.fixture(scope="module")
+def basis_dict_anorcc():
+    """Return the ANO-RCC basis set (parsed once for all of the tests in this module)."""
+    return parse_nwchem(find_datafile("data_anorcc.nwchem"))
+
+
+@pytest.fixture(scope="module")
+def basis_kr(basis_dict_anorcc):
+    """Return the ANO-RCC basis set of two Kr atoms separated by 1 bohr."""
+    basis = make_contractions(basis_dict_anorcc, ["Kr", "Kr"], np.array([[0, 0, 0], [1.0, 0, 0]]))
+    return [HortonContractions(i.angmom, i.coord, i.coeffs, i.exps) for i in basis]
+
+
+@pytest.fixture(scope="module")
+def ref_cart(basis_kr):
+    """Return the overlap of the Cartesian contractions of `basis_kr` from `overlap_integral`."""
+    return overlap_integral(basis_kr, coord_type="cartesian")
+
+
+@pytest.fixture(scope="module")
+def ref_sph(basis_kr):
+    """Return the overlap of the spherical contractions of `basis_kr` from `overlap_integral`."""
+    return overlap_integral(basis_kr, coord_type="spherical")
+
+
+def test_overlap_integral_asymmetric_horton_anorcc_hhe(basis_dict_anorcc):
     """Test gbasis.integrals.overlap_asymm.overlap_integral_asymmetric against HORTON's overlap matrix.
 
     The test case is diatomic with H and He separated by 0.8 angstroms with basis set ANO-RCC.
 
     """
-    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
     # NOTE: used HORTON's conversion factor for angstroms to bohr
     basis = make_contractions(
-        basis_dict, ["H", "He"], np.array([[0, 0, 0], [0.8 * 1.0 / 0.5291772083, 0, 0]])
+        basis_dict_anorcc, ["H", "He"], np.array([[0, 0, 0], [0.8 * 1.0 / 0.5291772083, 0, 0]])
     )
     basis = [HortonContractions(i.angmom, i.coord, i.coeffs, i.exps) for i in basis]
 
@@ -28,16 +53,15 @@ def test_overlap_integral_asymmetric_horton_anorcc_hhe():
     )
 
 
-def test_overlap_integral_asymmetric_horton_anorcc_bec():
+def test_overlap_integral_asymmetric_horton_anorcc_bec(basis_dict_anorcc):
     """Test integrals.overlap_asymm.overlap_integral_asymmetric against HORTON's overlap matrix.
 
     The test case is diatomic with Be and C separated by 1.0 angstroms with basis set ANO-RCC.
 
     """
-    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
     # NOTE: used HORTON's conversion factor for angstroms to bohr
     basis = make_contractions(
-        basis_dict, ["Be", "C"], np.array([[0, 0, 0], [1.0 * 1.0 / 0.5291772083, 0, 0]])
+        basis_dict_anorcc, ["Be", "C"], np.array([[0, 0, 0], [1.0 * 1.0 / 0.5291772083, 0, 0]])
     )
     basis = [HortonContractions(i.angmom, i.coord, i.coeffs, i.exps) for i in basis]
 
@@ -50,42 +74,38 @@ def test_overlap_integral_asymmetric_horton_anorcc_bec():
     )
 
 
-def test_overlap_integral_asymmetric_compare():
+@pytest.mark.parametrize(
+    "coord_type",
+    ["cartesian", "spherical", ["spherical"] * 9 + ["cartesian"]],
+    ids=["cartesian", "spherical", "mix"],
+)
+def test_overlap_integral_asymmetric_compare(basis_kr, ref_cart, ref_sph, coord_type):
     """Test overlap_asymm.overlap_integral_asymmetric against overlap.overlap_integral."""
-    basis_dict = parse_nwchem(find_datafile("data_anorcc.nwchem"))
-
-    basis = make_contractions(basis_dict, ["Kr", "Kr"], np.array([[0, 0, 0], [1.0, 0, 0]]))
-    basis = [HortonContractions(i.angmom, i.coord, i.coeffs, i.exps) for i in basis]
-
+    if coord_type == "cartesian":
+        ref = ref_cart
+    elif coord_type == "spherical":
+        ref = ref_sph
+    else:
+        ref = overlap_integral(basis_kr, coord_type=coord_type)
     assert np.allclose(
-        overlap_integral(basis, coord_type="cartesian"),
+        ref,
         overlap_integral_asymmetric(
-            basis, basis, coord_type_one="cartesian", coord_type_two="cartesian"
-        ),
-    )
-    assert np.allclose(
-        overlap_integral(basis, coord_type="spherical"),
-        overlap_integral_asymmetric(
-            basis, basis, coord_type_one="spherical", coord_type_two="spherical"
+            basis_kr, basis_kr, coord_type_one=coord_type, coord_type_two=coord_type
         ),
     )
+
+
+def test_overlap_integral_asymmetric_compare_transform(basis_kr, ref_sph):
+    """Test overlap_asymm.overlap_integral_asymmetric with transform against overlap_integral."""
+    # NOTE: identity transformation gives the overlap of the spherical contractions
     assert np.allclose(
-        overlap_integral(basis, transform=np.identity(218), coord_type="spherical"),
+        ref_sph,
         overlap_integral_asymmetric(
-            basis,
-            basis,
+            basis_kr,
+            basis_kr,
             transform_one=np.identity(218),
             transform_two=np.identity(218),
             coord_type_one="spherical",
             coord_type_two="spherical",
         ),
     )
-    assert np.allclose(
-        overlap_integral(basis, coord_type=["spherical"] * 9 + ["cartesian"]),
-        overlap_integral_asymmetric(
-            basis,
-            basis,
-            coord_type_one=["spherical"] * 9 + ["cartesian"],
-            coord_type_two=["spherical"] * 9 + ["cartesian"],
-        ),
-    )